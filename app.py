@@ -2,6 +2,7 @@ from datetime import date, timedelta
 from pathlib import Path
 
 import altair as alt
+import pandas as pd
 import polars as pl
 import streamlit as st
 
@@ -10,6 +11,9 @@ DATA_PATH = "data.parquet"
 DEFAULT_FOCUS = ["LATINO", "Global", "Brasil", "México", "Colombia", "Argentina", "Chile", "Perú"]
 RISK_COUNTRIES = {"LATINO", "Global"}
 PERIOD_LABELS = ["1D", "1M", "MTD", "QTD", "YTD"]
+ROLLING_WINDOW = 50
+DOWNSAMPLE_AFTER_DAYS = 2000
+DOWNSAMPLE_PERIOD = "W"
 PALETTE = [
     "#66E3D4",
     "#F6B26B",
@@ -184,22 +188,27 @@ def normalize_region_name(region: str) -> str:
     }.get(region, region)
 
 
-@st.cache_data(show_spinner=False)
-def load_data(path: str = DATA_PATH) -> pl.DataFrame:
+def data_mtime(path: str = DATA_PATH) -> float:
+    source = Path(path)
+    return source.stat().st_mtime if source.exists() else 0.0
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def load_data(path: str, mtime: float) -> tuple[pl.DataFrame, date, date]:
     if not Path(path).exists():
         st.error(f"{path} not found.")
         st.stop()
 
     lf = pl.scan_parquet(path)
-    schema = lf.collect_schema()
-    if "Date" in schema and "date" not in schema:
+    columns = lf.collect_schema().names()
+    if "Date" in columns and "date" not in columns:
         lf = lf.rename({"Date": "date"})
+        columns = ["date" if col == "Date" else col for col in columns]
 
-    schema = lf.collect_schema()
-    if {"date", "region", "value"}.issubset(schema):
+    if {"date", "region", "value"}.issubset(columns):
         normalized = lf.select(["date", "region", "value"])
     else:
-        value_cols = [col for col in schema if col != "date"]
+        value_cols = [col for col in columns if col != "date"]
         normalized = lf.unpivot(
             index="date",
             on=value_cols,
@@ -207,21 +216,45 @@ def load_data(path: str = DATA_PATH) -> pl.DataFrame:
             value_name="value",
         )
 
-    return (
+    df = (
         normalized.with_columns(
             pl.col("date").cast(pl.Date),
-            pl.col("region").cast(pl.Utf8),
+            pl.col("region").cast(pl.Categorical),
             pl.col("value").cast(pl.Float64),
         )
         .drop_nulls(["date", "region", "value"])
         .sort(["region", "date"])
         .collect()
     )
+    bounds = df.select(
+        pl.col("date").min().alias("min_date"),
+        pl.col("date").max().alias("max_date"),
+    )
+    return df, bounds.item(0, "min_date"), bounds.item(0, "max_date")
 
 
-def observation_on_or_before(df: pl.DataFrame, cutoff: date) -> date | None:
-    result = df.filter(pl.col("date") <= cutoff).select(pl.col("date").max()).item()
-    return result
+@st.cache_resource(show_spinner=False)
+def seen_data_versions() -> set[float]:
+    return set()
+
+
+def drop_stale_data(mtime: float) -> None:
+    # The disk cache never evicts, so wipe every mtime-keyed cache once a new data version shows up.
+    versions = seen_data_versions()
+    if mtime in versions:
+        return
+    if versions:
+        for cached in (
+            load_data,
+            load_metrics,
+            load_snapshot_pd,
+            load_ranked_pd,
+            load_movers_pd,
+            load_series_pd,
+            load_rolling_pd,
+        ):
+            cached.clear()
+    versions.add(mtime)
 
 
 def period_cutoffs(df: pl.DataFrame, latest_date: date) -> dict[str, date | None]:
@@ -234,32 +267,30 @@ def period_cutoffs(df: pl.DataFrame, latest_date: date) -> dict[str, date | None
         "QTD": date(latest_date.year, quarter_start_month, 1),
         "YTD": date(latest_date.year, 1, 1),
     }
-    return {label: observation_on_or_before(df, cutoff) for label, cutoff in anchors.items()}
+    dates = df.get_column("date").unique().sort()
+    positions = dates.search_sorted(pl.Series(list(anchors.values()), dtype=pl.Date), side="right")
+    return {label: dates[pos - 1] if pos else None for label, pos in zip(anchors, positions)}
 
 
 def build_metrics(df: pl.DataFrame, latest_date: date, cutoffs: dict[str, date | None]) -> pl.DataFrame:
-    latest = (
-        df.filter(pl.col("date") == latest_date)
-        .select("region", pl.col("value").alias("spread_pct"))
+    latest_value = pl.col("value").filter(pl.col("date") == latest_date).last()
+    period_changes = [
+        (
+            pl.lit(None, dtype=pl.Float64)
+            if cutoff is None
+            else (latest_value - pl.col("value").filter(pl.col("date") <= cutoff).last()) * 100
+        ).alias(f"{label} bps")
+        for label, cutoff in cutoffs.items()
+    ]
+    metrics = (
+        df.group_by("region")
+        .agg(latest_value.alias("spread_pct"), *period_changes)
+        .drop_nulls("spread_pct")
     )
 
-    metrics = latest
-    for label, cutoff in cutoffs.items():
-        if cutoff is None:
-            metrics = metrics.with_columns(pl.lit(None, dtype=pl.Float64).alias(f"{label} bps"))
-            continue
-        reference = (
-            df.filter(pl.col("date") == cutoff)
-            .select("region", pl.col("value").alias(f"{label}_ref"))
-        )
-        metrics = metrics.join(reference, on="region", how="left").with_columns(
-            ((pl.col("spread_pct") - pl.col(f"{label}_ref")) * 100).alias(f"{label} bps")
-        ).drop(f"{label}_ref")
-
-    latam = metrics.filter(pl.col("region") == "LATINO").select("spread_pct").to_series()
-    global_spread = metrics.filter(pl.col("region") == "Global").select("spread_pct").to_series()
-    latam_value = latam[0] if len(latam) else metrics.select(pl.col("spread_pct").mean()).item()
-    global_value = global_spread[0] if len(global_spread) else None
+    levels = dict(metrics.select("region", "spread_pct").iter_rows())
+    latam_value = levels["LATINO"] if "LATINO" in levels else metrics["spread_pct"].mean()
+    global_value = levels.get("Global")
 
     metrics = metrics.with_columns(
         (pl.col("spread_pct") * 100).alias("spread_bps"),
@@ -288,6 +319,113 @@ def add_percentile_rank(df: pl.DataFrame, metrics: pl.DataFrame) -> pl.DataFrame
     return metrics.join(percentiles, on="region", how="left")
 
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_metrics(path: str, mtime: float) -> pl.DataFrame:
+    df, _, latest_date = load_data(path, mtime)
+    cutoffs = period_cutoffs(df, latest_date)
+    return add_percentile_rank(df, build_metrics(df, latest_date, cutoffs))
+
+
+def ranking_filter(show_outliers: bool) -> pl.Expr:
+    rank_filter = ~pl.col("region").is_in(RISK_COUNTRIES)
+    if not show_outliers:
+        rank_filter = rank_filter & (pl.col("region") != "Venezuela")
+    return rank_filter
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_snapshot_pd(path: str, mtime: float) -> pd.DataFrame:
+    display_cols = [
+        "Market",
+        "spread_bps",
+        "1D bps",
+        "1M bps",
+        "MTD bps",
+        "QTD bps",
+        "YTD bps",
+        "vs LatAm bps",
+        "historical percentile",
+    ]
+    snapshot = load_metrics(path, mtime).select(display_cols).rename(
+        {
+            "spread_bps": "Spread",
+            "historical percentile": "Hist. Percentile",
+        }
+    )
+    return snapshot.to_pandas()
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_ranked_pd(path: str, mtime: float, show_outliers: bool) -> pd.DataFrame:
+    return (
+        load_metrics(path, mtime)
+        .filter(ranking_filter(show_outliers))
+        .sort("spread_bps", descending=True)
+        .select(["Market", "spread_bps", "vs LatAm bps"])
+        .to_pandas()
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=len(PERIOD_LABELS) * 2)
+def load_movers_pd(path: str, mtime: float, period: str, show_outliers: bool) -> pd.DataFrame:
+    change_col = f"{period} bps"
+    return (
+        load_metrics(path, mtime)
+        .filter(ranking_filter(show_outliers) & pl.col(change_col).is_not_null())
+        .with_columns(
+            pl.when(pl.col(change_col) >= 0)
+            .then(pl.lit("Widening"))
+            .otherwise(pl.lit("Tightening"))
+            .alias("Direction")
+        )
+        .select(["Market", change_col, "Direction"])
+        .to_pandas()
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_series_pd(path: str, mtime: float) -> pd.DataFrame:
+    df, _, _ = load_data(path, mtime)
+    return (
+        df.with_columns(
+            pl.col("region").map_elements(normalize_region_name, return_dtype=pl.Utf8).alias("Market")
+        )
+        .to_pandas()
+        .set_index("date")
+        .sort_index()
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_rolling_pd(path: str, mtime: float) -> pd.DataFrame:
+    df, _, _ = load_data(path, mtime)
+    return (
+        df.with_columns(
+            (pl.col("value") * 100).alias("spread_bps"),
+            (pl.col("value").rolling_mean(ROLLING_WINDOW).over("region") * 100).alias("rolling_50d_bps"),
+            pl.col("region").map_elements(normalize_region_name, return_dtype=pl.Utf8).alias("Market"),
+        )
+        .to_pandas()
+        .set_index("date")
+        .sort_index()
+    )
+
+
+def window_series(series: pd.DataFrame, regions: list[str], start: date, end: date) -> pd.DataFrame:
+    window = series.loc[pd.Timestamp(start):pd.Timestamp(end)]
+    return window[window["region"].isin(regions)]
+
+
+def downsample(series: pd.DataFrame) -> pd.DataFrame:
+    if series.empty or (series.index.max() - series.index.min()).days <= DOWNSAMPLE_AFTER_DAYS:
+        return series
+    buckets = pd.DataFrame(
+        {"region": series["region"].to_numpy(), "period": series.index.to_period(DOWNSAMPLE_PERIOD)}
+    )
+    keep = ~buckets.duplicated(keep="last") | ~buckets["region"].duplicated()
+    return series[keep.to_numpy()]
+
+
 def format_bps(value: float | None) -> str:
     if value is None:
         return "-"
@@ -322,6 +460,107 @@ def chart_theme_config() -> dict:
     }
 
 
+def overview_detail(chart: alt.Chart) -> alt.VConcatChart:
+    brush = alt.selection_interval(encodings=["x"])
+    detail = chart.transform_filter(brush).properties(width="container", height=320)
+    overview = (
+        chart.mark_line(strokeWidth=1.2)
+        .encode(tooltip=alt.value(None))
+        .add_params(brush)
+        .properties(width="container", height=70)
+    )
+    return alt.vconcat(detail, overview, spacing=8)
+
+
+@st.fragment
+def selected_market_charts(
+    mtime: float,
+    regions: list[str],
+    min_date: date,
+    latest_date: date,
+    period: str,
+    show_outliers: bool,
+) -> None:
+    left, right = st.columns((1.35, 1))
+    with left:
+        st.subheader("Trend: Selected Markets")
+        st.markdown('<div class="section-note">Raw EMBI spread in percentage points. Keep market selection focused for readable comparison. Windows longer than about five years show the last observation of each week; narrow the date range for daily detail. Drag across the lower strip to zoom; double-click it to reset.</div>', unsafe_allow_html=True)
+        start_date, end_date = st.slider(
+            "Date range",
+            min_value=min_date,
+            max_value=latest_date,
+            value=(max(latest_date - timedelta(days=365 * 3), min_date), latest_date),
+            format="YYYY-MM-DD",
+        )
+        window = window_series(load_series_pd(DATA_PATH, mtime), regions, start_date, end_date)
+        window = window.assign(
+            indexed=window["value"] / window.groupby("region", observed=True)["value"].transform("first") * 100
+        )
+        series = downsample(window).reset_index()
+        trend = (
+            alt.Chart(series[["date", "Market", "value"]])
+            .mark_line(strokeWidth=2.4)
+            .encode(
+                x=alt.X("date:T", title=None),
+                y=alt.Y("value:Q", title="Spread (%)", scale=alt.Scale(zero=False)),
+                color=alt.Color("Market:N", scale=alt.Scale(range=PALETTE), legend=alt.Legend(orient="bottom")),
+                tooltip=[
+                    alt.Tooltip("date:T", title="Date"),
+                    alt.Tooltip("Market:N"),
+                    alt.Tooltip("value:Q", title="Spread (%)", format=".2f"),
+                ],
+            )
+        )
+        st.altair_chart(overview_detail(trend), width="stretch")
+
+    with right:
+        st.subheader(f"{period} Movers")
+        st.markdown('<div class="section-note">Largest spread changes among country series.</div>', unsafe_allow_html=True)
+        movers = load_movers_pd(DATA_PATH, mtime, period, show_outliers)
+        mover_chart = (
+            alt.Chart(movers)
+            .mark_bar(cornerRadiusEnd=5)
+            .encode(
+                x=alt.X(f"{period} bps:Q", title="Change (bps)"),
+                y=alt.Y(
+                    "Market:N",
+                    sort=alt.EncodingSortField(field=f"{period} bps", order="descending"),
+                    title=None,
+                    axis=alt.Axis(labelLimit=180, labelOverlap=False, labelPadding=8),
+                ),
+                color=alt.Color(
+                    "Direction:N",
+                    scale=alt.Scale(domain=["Widening", "Tightening"], range=["#FF8A80", "#9BD67D"]),
+                    legend=None,
+                ),
+                tooltip=[
+                    alt.Tooltip("Market:N"),
+                    alt.Tooltip(f"{period} bps:Q", title="Change", format="+,.0f"),
+                ],
+            )
+        )
+        st.altair_chart(mover_chart.properties(height=max(420, 32 * len(movers))), width="stretch")
+
+    st.subheader("Relative Performance")
+    st.markdown('<div class="section-note">Selected markets indexed to 100 at the beginning of the displayed window; useful for relative moves when spread levels differ.</div>', unsafe_allow_html=True)
+    indexed_chart = (
+        alt.Chart(series[["date", "Market", "indexed"]])
+        .mark_line(strokeWidth=2.4)
+        .encode(
+            x=alt.X("date:T", title=None),
+            y=alt.Y("indexed:Q", title="Index, first visible date = 100", scale=alt.Scale(zero=False)),
+            color=alt.Color("Market:N", scale=alt.Scale(range=PALETTE), legend=alt.Legend(orient="bottom")),
+            tooltip=[
+                alt.Tooltip("date:T", title="Date"),
+                alt.Tooltip("Market:N"),
+                alt.Tooltip("indexed:Q", title="Index", format=".1f"),
+            ],
+        )
+        .interactive()
+    )
+    st.altair_chart(indexed_chart, width="stretch")
+
+
 if hasattr(alt, "theme"):
     @alt.theme.register("embi_theme", enable=True)
     def embi_theme():
@@ -331,22 +570,23 @@ else:
     alt.themes.enable("embi_theme")
 inject_css()
 
-df = load_data()
+data_version = data_mtime()
+drop_stale_data(data_version)
+df, min_date, latest_date = load_data(DATA_PATH, data_version)
 if not {"date", "region", "value"}.issubset(df.columns):
     st.error("Dataset missing required columns: date, region, value.")
     st.stop()
 
-min_date = df.select(pl.col("date").min()).item()
-latest_date = df.select(pl.col("date").max()).item()
-cutoffs = period_cutoffs(df, latest_date)
-metrics = add_percentile_rank(df, build_metrics(df, latest_date, cutoffs))
+metrics = load_metrics(DATA_PATH, data_version)
 regions = metrics["region"].to_list()
 
-latest_latam = metrics.filter(pl.col("region") == "LATINO")
-latam_spread = latest_latam.select("spread_bps").item() if latest_latam.height else None
-latam_1m = latest_latam.select("1M bps").item() if latest_latam.height else None
-latest_global = metrics.filter(pl.col("region") == "Global")
-global_spread = latest_global.select("spread_bps").item() if latest_global.height else None
+benchmarks = {
+    row["region"]: row
+    for row in metrics.filter(pl.col("region").is_in(RISK_COUNTRIES)).iter_rows(named=True)
+}
+latam_spread = benchmarks.get("LATINO", {}).get("spread_bps")
+latam_1m = benchmarks.get("LATINO", {}).get("1M bps")
+global_spread = benchmarks.get("Global", {}).get("spread_bps")
 high_risk = metrics.filter(~pl.col("region").is_in(RISK_COUNTRIES)).head(1)
 largest_widener = metrics.filter(~pl.col("region").is_in(RISK_COUNTRIES)).sort("1M bps", descending=True).head(1)
 largest_tightener = metrics.filter(~pl.col("region").is_in(RISK_COUNTRIES)).sort("1M bps").head(1)
@@ -358,13 +598,6 @@ with st.sidebar:
     selected_regions = st.multiselect("Markets", regions, default=default_markets)
     selected_regions = selected_regions or default_markets or regions[:8]
 
-    start_date, end_date = st.slider(
-        "Date range",
-        min_value=min_date,
-        max_value=latest_date,
-        value=(max(latest_date - timedelta(days=365 * 3), min_date), latest_date),
-        format="YYYY-MM-DD",
-    )
     comparison_period = st.selectbox("Movement ranking period", PERIOD_LABELS, index=1)
     detail_default = "LATINO" if "LATINO" in regions else regions[0]
     detail_region = st.selectbox(
@@ -429,25 +662,8 @@ st.markdown(
     "90% means today's spread is higher than roughly 90% of past observations.</div>",
     unsafe_allow_html=True,
 )
-display_cols = [
-    "Market",
-    "spread_bps",
-    "1D bps",
-    "1M bps",
-    "MTD bps",
-    "QTD bps",
-    "YTD bps",
-    "vs LatAm bps",
-    "historical percentile",
-]
-snapshot = metrics.select(display_cols).rename(
-    {
-        "spread_bps": "Spread",
-        "historical percentile": "Hist. Percentile",
-    }
-)
 st.dataframe(
-    snapshot.to_pandas(),
+    load_snapshot_pd(DATA_PATH, data_version),
     width="stretch",
     hide_index=True,
     column_config={
@@ -468,14 +684,10 @@ st.dataframe(
     },
 )
 
-rank_filter = ~pl.col("region").is_in(RISK_COUNTRIES)
-if not show_outliers:
-    rank_filter = rank_filter & (pl.col("region") != "Venezuela")
-ranked = metrics.filter(rank_filter).sort("spread_bps", descending=True)
-ranked_pd = ranked.select(["Market", "spread_bps", "vs LatAm bps"]).to_pandas()
+ranked = load_ranked_pd(DATA_PATH, data_version, show_outliers)
 
 bars = (
-    alt.Chart(ranked_pd)
+    alt.Chart(ranked)
     .mark_bar(cornerRadiusEnd=5, color="#66E3D4")
     .encode(
         x=alt.X("spread_bps:Q", title="Spread (bps)"),
@@ -495,104 +707,18 @@ bars = (
 latam_rule = alt.Chart({"values": [{"x": latam_spread}]}).mark_rule(
     color="#F6B26B", strokeDash=[6, 4], strokeWidth=2
 ).encode(x="x:Q")
-st.altair_chart((bars + latam_rule).properties(height=max(420, 34 * ranked.height)), width="stretch")
-
-left, right = st.columns((1.35, 1))
-with left:
-    st.subheader("Trend: Selected Markets")
-    st.markdown('<div class="section-note">Raw EMBI spread in percentage points. Keep market selection focused for readable comparison.</div>', unsafe_allow_html=True)
-    series = df.filter(
-        pl.col("region").is_in(selected_regions)
-        & (pl.col("date") >= start_date)
-        & (pl.col("date") <= end_date)
-    ).with_columns(
-        pl.col("region").map_elements(normalize_region_name, return_dtype=pl.Utf8).alias("Market")
-    )
-    trend = (
-        alt.Chart(series.to_pandas())
-        .mark_line(strokeWidth=2.4)
-        .encode(
-            x=alt.X("date:T", title=None),
-            y=alt.Y("value:Q", title="Spread (%)", scale=alt.Scale(zero=False)),
-            color=alt.Color("Market:N", scale=alt.Scale(range=PALETTE), legend=alt.Legend(orient="bottom")),
-            tooltip=[
-                alt.Tooltip("date:T", title="Date"),
-                alt.Tooltip("Market:N"),
-                alt.Tooltip("value:Q", title="Spread (%)", format=".2f"),
-            ],
-        )
-        .interactive()
-    )
-    st.altair_chart(trend, width="stretch")
-
-with right:
-    st.subheader(f"{comparison_period} Movers")
-    st.markdown('<div class="section-note">Largest spread changes among country series.</div>', unsafe_allow_html=True)
-    movers = (
-        metrics.filter(~pl.col("region").is_in(RISK_COUNTRIES))
-        .filter(pl.col(f"{comparison_period} bps").is_not_null())
-        .with_columns(
-            pl.when(pl.col(f"{comparison_period} bps") >= 0)
-            .then(pl.lit("Widening"))
-            .otherwise(pl.lit("Tightening"))
-            .alias("Direction")
-        )
-    )
-    if not show_outliers:
-        movers = movers.filter(pl.col("region") != "Venezuela")
-    mover_chart = (
-        alt.Chart(movers.select(["Market", f"{comparison_period} bps", "Direction"]).to_pandas())
-        .mark_bar(cornerRadiusEnd=5)
-        .encode(
-            x=alt.X(f"{comparison_period} bps:Q", title="Change (bps)"),
-            y=alt.Y(
-                "Market:N",
-                sort=alt.EncodingSortField(field=f"{comparison_period} bps", order="descending"),
-                title=None,
-                axis=alt.Axis(labelLimit=180, labelOverlap=False, labelPadding=8),
-            ),
-            color=alt.Color(
-                "Direction:N",
-                scale=alt.Scale(domain=["Widening", "Tightening"], range=["#FF8A80", "#9BD67D"]),
-                legend=None,
-            ),
-            tooltip=[
-                alt.Tooltip("Market:N"),
-                alt.Tooltip(f"{comparison_period} bps:Q", title="Change", format="+,.0f"),
-            ],
-        )
-    )
-    st.altair_chart(mover_chart.properties(height=max(420, 32 * movers.height)), width="stretch")
+st.altair_chart((bars + latam_rule).properties(height=max(420, 34 * len(ranked))), width="stretch")
 
-st.subheader("Relative Performance")
-st.markdown('<div class="section-note">Selected markets indexed to 100 at the beginning of the displayed window; useful for relative moves when spread levels differ.</div>', unsafe_allow_html=True)
-indexed = (
-    series.sort(["region", "date"])
-    .with_columns((pl.col("value") / pl.col("value").first().over("region") * 100).alias("indexed"))
+selected_market_charts(
+    data_version, selected_regions, min_date, latest_date, comparison_period, show_outliers
 )
-indexed_chart = (
-    alt.Chart(indexed.to_pandas())
-    .mark_line(strokeWidth=2.4)
-    .encode(
-        x=alt.X("date:T", title=None),
-        y=alt.Y("indexed:Q", title="Index, first visible date = 100", scale=alt.Scale(zero=False)),
-        color=alt.Color("Market:N", scale=alt.Scale(range=PALETTE), legend=alt.Legend(orient="bottom")),
-        tooltip=[
-            alt.Tooltip("date:T", title="Date"),
-            alt.Tooltip("Market:N"),
-            alt.Tooltip("indexed:Q", title="Index", format=".1f"),
-        ],
-    )
-    .interactive()
-)
-st.altair_chart(indexed_chart, width="stretch")
 
 st.subheader(f"Detail: {normalize_region_name(detail_region)}")
 detail_metrics = metrics.filter(pl.col("region") == detail_region)
-detail_series = df.filter(pl.col("region") == detail_region).sort("date").with_columns(
-    (pl.col("value") * 100).alias("spread_bps"),
-    (pl.col("value").rolling_mean(50) * 100).alias("rolling_50d_bps"),
-)
+rolling = load_rolling_pd(DATA_PATH, data_version)
+detail_series = rolling[rolling["region"] == detail_region].reset_index()[
+    ["date", "spread_bps", "rolling_50d_bps"]
+]
 
 d1, d2, d3, d4 = st.columns(4)
 d1.metric("Latest Spread", format_bps(detail_metrics.select("spread_bps").item()))
@@ -604,7 +730,7 @@ hist_pct = detail_metrics.select("historical percentile").item()
 d4.metric("Historical Percentile", "-" if hist_pct is None else f"{hist_pct:.0f}%")
 
 detail_chart = (
-    alt.Chart(detail_series.to_pandas())
+    alt.Chart(detail_series)
     .transform_fold(["spread_bps", "rolling_50d_bps"], as_=["Series", "Spread"])
     .mark_line(strokeWidth=2.5)
     .encode(
@@ -624,9 +750,9 @@ detail_chart = (
             alt.Tooltip("Series:N"),
         ],
     )
-    .interactive()
 )
-st.altair_chart(detail_chart, width="stretch")
+st.markdown('<div class="section-note">Daily spread and 50-day average. Drag across the lower strip to zoom; double-click it to reset.</div>', unsafe_allow_html=True)
+st.altair_chart(overview_detail(detail_chart), width="stretch")
 
 with st.expander("Data notes and interpretation"):
     st.markdown(
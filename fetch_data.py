@@ -1,6 +1,5 @@
-import datetime as dt
-import io
-from functools import reduce
+import tempfile
+from pathlib import Path
 
 import polars as pl
 import requests
@@ -10,39 +9,29 @@ SOURCE_URL = "https://bcrdgdcprod.blob.core.windows.net/documents/entorno-intern
 SHEET_NAME = "Serie Histórica"
 OUTPUT_PATH = "data.parquet"
 EXPECTED_DATE_COLUMN = "Fecha"
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DATE_PATTERNS = ("%Y-%m-%d", "%d-%b-%y", "%d-%b-%Y")
 
 
-def parse_mixed_date(value: object) -> str | None:
-    if value is None:
-        return None
-    if isinstance(value, (dt.datetime, dt.date)):
-        return value.strftime("%Y-%m-%d")
-
-    text = str(value).strip()
-    patterns = (
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%d-%b-%y",
-        "'%d-%b-%y",
-        "%d-%b-%Y",
+def parse_mixed_date(column: str) -> pl.Expr:
+    text = pl.col(column).cast(pl.Utf8).str.strip_chars().str.strip_chars_start("'")
+    return pl.coalesce(
+        text.str.strptime(pl.Datetime, format="%Y-%m-%d %H:%M:%S", strict=False).dt.date(),
+        *(text.str.strptime(pl.Date, format=pattern, strict=False) for pattern in DATE_PATTERNS),
     )
-    for pattern in patterns:
-        try:
-            return dt.datetime.strptime(text, pattern).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-    return None
 
 
-def download_source() -> bytes:
-    response = requests.get(SOURCE_URL, timeout=30)
-    response.raise_for_status()
-    return response.content
+def download_source(destination: Path) -> None:
+    with requests.get(SOURCE_URL, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        with destination.open("wb") as handle:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                handle.write(chunk)
 
 
-def read_source_excel(content: bytes) -> pl.DataFrame:
+def read_source_excel(source: Path) -> pl.DataFrame:
     raw = pl.read_excel(
-        io.BytesIO(content),
+        source,
         sheet_name=SHEET_NAME,
         columns=list(range(20)),
     )
@@ -58,25 +47,18 @@ def clean_embi_data(df: pl.DataFrame) -> pl.DataFrame:
     if EXPECTED_DATE_COLUMN not in df.columns:
         raise ValueError(f"Source workbook is missing the expected '{EXPECTED_DATE_COLUMN}' column.")
 
-    df = df.with_columns(
-        pl.col(EXPECTED_DATE_COLUMN)
-        .map_elements(parse_mixed_date, return_dtype=pl.Utf8)
-        .str.strptime(pl.Date, format="%Y-%m-%d", strict=False)
-        .alias("Date")
-    ).drop(EXPECTED_DATE_COLUMN)
+    if df.schema[EXPECTED_DATE_COLUMN].is_temporal():
+        parsed_date = pl.col(EXPECTED_DATE_COLUMN).cast(pl.Date)
+    else:
+        parsed_date = parse_mixed_date(EXPECTED_DATE_COLUMN)
+    df = df.with_columns(parsed_date.alias("Date")).drop(EXPECTED_DATE_COLUMN)
 
     value_columns = [col for col in df.columns if col != "Date"]
     if not value_columns:
         raise ValueError("Source workbook has no EMBI spread columns.")
 
-    invalid_tokens = ["`", "N/A"]
-    valid_conditions = [pl.col("Date").is_not_null()]
-    for col in value_columns:
-        as_text = pl.col(col).cast(pl.Utf8).str.strip_chars()
-        valid_conditions.extend(~as_text.str.contains(token, literal=True) for token in invalid_tokens)
-        valid_conditions.append(as_text != "")
-
-    df = df.filter(reduce(lambda acc, expr: acc & expr, valid_conditions))
+    # Placeholders such as "N/A", "`" or blank cells fail the non-strict cast
+    # and become nulls, so dropping nulls also drops those rows.
     df = df.with_columns([pl.col(col).cast(pl.Float64, strict=False) for col in value_columns])
     df = df.drop_nulls(["Date", *value_columns])
 
@@ -88,12 +70,21 @@ def clean_embi_data(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def main() -> None:
-    content = download_source()
-    df = clean_embi_data(read_source_excel(content))
+    with tempfile.TemporaryDirectory() as workdir:
+        source = Path(workdir) / "source.xlsx"
+        download_source(source)
+        df = clean_embi_data(read_source_excel(source))
     if df.height == 0:
         raise ValueError("Cleaned EMBI dataset is empty.")
 
-    df.write_parquet(OUTPUT_PATH)
+    df.write_parquet(
+        OUTPUT_PATH,
+        compression="zstd",
+        compression_level=3,
+        statistics=True,
+        row_group_size=65_536,
+        data_page_size=1 << 20,
+    )
     print(f"Wrote {OUTPUT_PATH}: {df.height} rows, {len(df.columns) - 1} series.")
     print(f"Latest observation: {df.select(pl.col('Date').max()).item()}")
 